@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import copy
 import functools
 import inspect
 import types
@@ -236,6 +237,75 @@ def _is_object_schema(
     )
 
 
+# Bound values of these exact types are cached by ``repr``, which is unique per
+# value within each type (including ``-0.0`` vs ``0.0``). Anything else, such as
+# a container whose elements compare equal across types, skips the cache.
+_CACHEABLE_BOUND_TYPES = frozenset({int, float, str, bool, bytes, type(None)})
+
+
+class _PartialSchemaKey:
+    """Hashable stand-in for a ``functools.partial`` when caching its schema.
+
+    Every ``functools.partial(...)`` call produces a new object that hashes by
+    identity, so equivalent partials never hit ``get_cached_typeadapter``. This
+    key compares partials by what determines their input schema instead: the
+    wrapped callable, the bound arguments, and any ``__wrapped__`` or
+    ``__signature__`` override (e.g. from ``functools.update_wrapper``).
+    """
+
+    __slots__ = ("fn", "key")
+
+    def __init__(self, fn: functools.partial[Any], key: tuple[Any, ...]) -> None:
+        self.fn = fn
+        self.key = key
+
+    def __hash__(self) -> int:
+        return hash(self.key)
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _PartialSchemaKey) and self.key == other.key
+
+
+def _partial_schema_key(fn: functools.partial[Any]) -> _PartialSchemaKey | None:
+    """Build a cache key for ``fn``, or None if it shouldn't be cached.
+
+    Only partials whose bound values are all plain scalars get a key; each value
+    is keyed by its type and ``repr`` so ``b=1``, ``b=True`` and ``b=1.0`` stay
+    distinct.
+    """
+    values = (*fn.args, *fn.keywords.values())
+    if any(type(value) not in _CACHEABLE_BOUND_TYPES for value in values):
+        return None
+    try:
+        key = (
+            fn.func,
+            tuple((type(arg), repr(arg)) for arg in fn.args),
+            frozenset(
+                (name, type(value), repr(value)) for name, value in fn.keywords.items()
+            ),
+            fn.__dict__.get("__wrapped__"),
+            fn.__dict__.get("__signature__"),
+        )
+        hash(key)
+    except TypeError:
+        return None
+    return _PartialSchemaKey(fn, key)
+
+
+def _build_input_schema(fn: Callable[..., Any]) -> dict[str, Any]:
+    input_schema = get_cached_typeadapter(fn).json_schema()
+    return compress_schema(input_schema, prune_titles=True)
+
+
+@functools.lru_cache(maxsize=512)
+def _cached_partial_input_schema(key: _PartialSchemaKey) -> dict[str, Any]:
+    """Input schema for the first partial seen with this key.
+
+    Callers must copy the result before mutating it.
+    """
+    return _build_input_schema(key.fn)
+
+
 @dataclass
 class ParsedFunction:
     fn: Callable[..., Any]
@@ -306,10 +376,17 @@ class ParsedFunction:
         # Handle injected parameters (Context, Docket dependencies)
         wrapper_fn = without_injected_parameters(fn)
 
-        input_type_adapter = get_cached_typeadapter(wrapper_fn)
-        input_schema = input_type_adapter.json_schema()
-
-        input_schema = compress_schema(input_schema, prune_titles=True)
+        # Equivalent partials are distinct objects, so they would otherwise
+        # rebuild the TypeAdapter and schema every time they are registered.
+        schema_key = (
+            _partial_schema_key(wrapper_fn)
+            if isinstance(wrapper_fn, functools.partial)
+            else None
+        )
+        if schema_key is not None:
+            input_schema = copy.deepcopy(_cached_partial_input_schema(schema_key))
+        else:
+            input_schema = _build_input_schema(wrapper_fn)
 
         # Inject parameter descriptions from the docstring into the schema.
         # Explicit annotations (Field(description=...), Annotated[x, "..."])
@@ -0,0 +1,42 @@
+"""Helpers for preparing plain callables to become FastMCP components."""
+
+import functools
+from collections.abc import Callable
+from typing import Any
+
+# functools.WRAPPER_ASSIGNMENTS minus __annotations__ and __type_params__, which
+# describe fn's full signature rather than the partial's, and without
+# update_wrapper's __wrapped__ link.
+_IDENTITY_ATTRIBUTES = ("__module__", "__name__", "__qualname__", "__doc__")
+
+
+def wrapped_partial(
+    fn: Callable[..., Any], /, *args: Any, **kwargs: Any
+) -> functools.partial[Any]:
+    """Bind arguments to ``fn`` while keeping its name and docstring.
+
+    A bare ``functools.partial`` is named ``partial`` and carries the partial
+    class's docstring, so a tool built from it gets that name and description.
+    The usual fix, ``functools.update_wrapper``, also sets ``__wrapped__``.
+    ``inspect.signature`` follows ``__wrapped__`` back to ``fn``, which makes the
+    bound arguments show up as required parameters again. This helper copies
+    only the identifying attributes and leaves the partial's signature alone.
+
+    Example:
+        ```python
+        from fastmcp.tools import Tool
+        from fastmcp.utilities.func import wrapped_partial
+
+        def greet(greeting: str, name: str) -> str:
+            return f"{greeting}, {name}!"
+
+        tool = Tool.from_function(wrapped_partial(greet, greeting="Hey"))
+        assert tool.name == "greet"
+        assert tool.parameters["required"] == ["name"]
+        ```
+    """
+    partial_fn = functools.partial(fn, *args, **kwargs)
+    for attr in _IDENTITY_ATTRIBUTES:
+        if hasattr(fn, attr):
+            setattr(partial_fn, attr, getattr(fn, attr))
+    return partial_fn
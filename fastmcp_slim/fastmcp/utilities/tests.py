@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import asyncio
-import copy
 import multiprocessing
 import socket
 import time
@@ -31,6 +30,12 @@ if TYPE_CHECKING:
 
     from fastmcp.server.server import FastMCP
 
+# The origin `asgi_server` serves every app at. Nothing listens on it; it exists so
+# that URLs are well-formed and so that host-header checks see a loopback address,
+# as they would locally. Use it for anything that must agree with the in-process
+# server's URLs, such as an OAuth provider's issuer.
+ASGI_BASE_URL = "http://127.0.0.1"
+
 
 @contextmanager
 def temporary_settings(**kwargs: Any):
@@ -51,7 +56,9 @@ def temporary_settings(**kwargs: Any):
         assert fastmcp.settings.log_level == 'INFO'
         ```
     """
-    old_settings = copy.deepcopy(settings)
+    # Only the overridden values need restoring, so snapshot just those rather
+    # than deep-copying the whole settings model on every call.
+    old_values = {attr: settings.get_setting(attr) for attr in kwargs}
 
     try:
         # apply the new settings
@@ -61,8 +68,8 @@ def temporary_settings(**kwargs: Any):
 
     finally:
         # restore the old settings
-        for attr in kwargs:
-            settings.set_setting(attr, old_settings.get_setting(attr))
+        for attr, value in old_values.items():
+            settings.set_setting(attr, value)
 
 
 def _run_server(mcp_server: FastMCP, transport: Literal["sse"], port: int) -> None:
@@ -188,9 +195,16 @@ async def run_server_async(
     than an in-process client. Otherwise prefer `asgi_client` or `asgi_server`, which
     exercise the same HTTP stack without binding a port.
 
+    When no port is given, the listening socket is bound to an OS-assigned port here
+    and handed to uvicorn as-is. Nothing else can claim the port between picking it
+    and serving on it, so parallel test workers never collide.
+
+    Uvicorn's access log is turned off; tests assert on responses, not log lines. The
+    ASGI lifespan stays on because it starts the server's session manager.
+
     Args:
         server: FastMCP server instance
-        port: Port to bind to (default: find available port)
+        port: Port to bind to (default: an OS-assigned port)
         transport: Transport type ("http", "streamable-http", or "sse")
         path: URL path for the server (default: "/mcp")
         host: Host to bind to (default: "127.0.0.1")
@@ -222,34 +236,47 @@ async def run_server_async(
                 assert result.content[0].text == "Hello, World!"
         ```
     """
-    if port is None:
-        port = find_available_port()
-
-    # Start server as a background task
-    server_task = asyncio.create_task(
-        server.run_http_async(
-            host=host,
-            port=port,
-            transport=transport,
-            path=path,
-            show_banner=False,
+    sockets: list[socket.socket] | None = None
+    server_task: asyncio.Task[None] | None = None
+    try:
+        if not port:
+            family = socket.AF_INET6 if ":" in host else socket.AF_INET
+            sock = socket.socket(family, socket.SOCK_STREAM)
+            sockets = [sock]
+            sock.bind((host, 0))
+            port = sock.getsockname()[1]
+
+        # Start server as a background task
+        server_task = asyncio.create_task(
+            server.run_http_async(
+                host=host,
+                port=port,
+                transport=transport,
+                path=path,
+                show_banner=False,
+                uvicorn_config={"access_log": False},
+                sockets=sockets,
+            )
         )
-    )
 
-    # Wait for server lifespan to be ready
-    await server._started.wait()
+        # Wait for server lifespan to be ready
+        await server._started.wait()
 
-    # The lifespan completing does not guarantee uvicorn has bound the port yet, so
-    # poll until the socket accepts a connection rather than guessing at a sleep.
-    await _wait_for_port(host, port)
+        # The lifespan completing does not guarantee uvicorn has bound the port yet,
+        # so poll until the socket accepts a connection rather than guessing at a
+        # sleep.
+        await _wait_for_port(host, port)
 
-    try:
         yield f"http://{host}:{port}{path}"
     finally:
-        # Cleanup: cancel the task with timeout to avoid hanging on Windows
-        server_task.cancel()
-        with suppress(asyncio.CancelledError, asyncio.TimeoutError):
-            await asyncio.wait_for(server_task, timeout=2.0)
+        # Runs on startup failures too, so the task and socket never leak. Cancel
+        # with a timeout to avoid hanging on Windows.
+        if server_task is not None:
+            server_task.cancel()
+            with suppress(asyncio.CancelledError, asyncio.TimeoutError):
+                await asyncio.wait_for(server_task, timeout=2.0)
+        for sock in sockets or ():
+            sock.close()
 
 
 @dataclass(frozen=True)
@@ -264,11 +291,21 @@ class ASGIServer:
     Because nothing is listening on the network, a plain `httpx2.AsyncClient()` cannot
     reach this server. Use `client()` for a FastMCP client, `http_client()` for raw HTTP
     assertions, and `transport()` when you need to build the client transport yourself.
+
+    `base_url` is the origin the app is served at, e.g. for building OAuth issuer or
+    well-known URLs, and `url` is the MCP endpoint beneath it. When not given, it is
+    taken from `url`.
     """
 
     url: str
     app: ASGIApp
     transport_type: Literal["http", "streamable-http", "sse"]
+    base_url: str = ""
+
+    def __post_init__(self) -> None:
+        if not self.base_url:
+            parsed = urlparse(self.url)
+            object.__setattr__(self, "base_url", f"{parsed.scheme}://{parsed.netloc}")
 
     def http_client(
         self,
@@ -393,15 +430,12 @@ async def asgi_server(
 
     app = server.http_app(transport=transport, path=path, **http_app_kwargs)
 
-    # Nothing listens on this origin; it exists so that URLs are well-formed and so
-    # that host-header checks see a loopback address, as they would locally.
-    base_url = "http://127.0.0.1"
-
     async with run_asgi_lifespan(app):
         yield ASGIServer(
-            url=f"{base_url}{path}",
+            url=f"{ASGI_BASE_URL}{path}",
             app=app,
             transport_type=transport,
+            base_url=ASGI_BASE_URL,
         )
 
 
@@ -467,6 +501,9 @@ class HeadlessOAuth(OAuth):
 
     This simulates the complete OAuth flow programmatically by making HTTP requests
     instead of opening a browser and running a callback server. Useful for automated testing.
+
+    The authorization request is sent with `httpx_client_factory`, so when the transport
+    is built by `ASGIServer.transport()` the whole flow stays in-process.
     """
 
     def __init__(self, mcp_url: str, **kwargs):
@@ -476,7 +513,7 @@ class HeadlessOAuth(OAuth):
 
     async def redirect_handler(self, authorization_url: str) -> None:
         """Make HTTP request to authorization URL and store response for callback handler."""
-        async with httpx2.AsyncClient() as client:
+        async with self.httpx_client_factory() as client:
             response = await client.get(authorization_url, follow_redirects=False)
             self._stored_response = response
 
@@ -0,0 +1,63 @@
+"""Shared in-process OAuth servers for client auth tests."""
+
+from collections.abc import AsyncGenerator
+
+import pytest_asyncio
+
+from fastmcp.server.auth.auth import ClientRegistrationOptions
+from fastmcp.server.auth.providers.in_memory import InMemoryOAuthProvider
+from fastmcp.server.server import FastMCP
+from fastmcp.utilities.tests import ASGI_BASE_URL, ASGIServer, asgi_server
+
+
+def _oauth_server(provider: InMemoryOAuthProvider) -> FastMCP:
+    server = FastMCP("TestServer", auth=provider)
+
+    @server.tool
+    def greet(name: str) -> str:
+        return f"Hello, {name}!"
+
+    @server.tool
+    def add(a: int, b: int) -> int:
+        return a + b
+
+    return server
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def dcr_server() -> AsyncGenerator[
+    tuple[ASGIServer, InMemoryOAuthProvider], None
+]:
+    """An OAuth-protected server with dynamic client registration enabled.
+
+    Shared by every test in a module, so tests must register clients with
+    distinct ids. Tests using it need `pytest.mark.asyncio(loop_scope="module")`.
+    """
+    provider = InMemoryOAuthProvider(
+        base_url=ASGI_BASE_URL,
+        client_registration_options=ClientRegistrationOptions(
+            enabled=True,
+            valid_scopes=["read"],
+        ),
+    )
+    async with asgi_server(_oauth_server(provider)) as running_server:
+        yield running_server, provider
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def static_server() -> AsyncGenerator[
+    tuple[ASGIServer, InMemoryOAuthProvider], None
+]:
+    """An OAuth-protected server that only accepts pre-registered clients.
+
+    Dynamic client registration is disabled. Shared like `dcr_server`.
+    """
+    provider = InMemoryOAuthProvider(
+        base_url=ASGI_BASE_URL,
+        client_registration_options=ClientRegistrationOptions(
+            enabled=False,
+            valid_scopes=["read", "write"],
+        ),
+    )
+    async with asgi_server(_oauth_server(provider)) as running_server:
+        yield running_server, provider
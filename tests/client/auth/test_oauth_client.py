@@ -1,7 +1,6 @@
 import socket
 import time
 from unittest.mock import patch
-from urllib.parse import urlparse
 
 import anyio
 import httpx2
@@ -17,12 +16,15 @@ import fastmcp.utilities.http as http_module
 from fastmcp.client import Client
 from fastmcp.client.auth import OAuth
 from fastmcp.client.auth.oauth import TokenStorageAdapter
-from fastmcp.client.transports import StreamableHttpTransport
 from fastmcp.server.auth.auth import ClientRegistrationOptions
 from fastmcp.server.auth.providers.in_memory import InMemoryOAuthProvider
 from fastmcp.server.server import FastMCP
-from fastmcp.utilities.http import find_available_port
-from fastmcp.utilities.tests import HeadlessOAuth, run_server_async
+from fastmcp.utilities.tests import (
+    ASGI_BASE_URL,
+    ASGIServer,
+    HeadlessOAuth,
+    asgi_server,
+)
 
 
 def fastmcp_server(issuer_url: str):
@@ -69,24 +71,25 @@ class ExpiredFirstRegistrationProvider(InMemoryOAuthProvider):
 
 @pytest.fixture
 async def streamable_http_server():
-    """Start OAuth-enabled server."""
-    port = find_available_port()
-    server = fastmcp_server(f"http://127.0.0.1:{port}")
-    async with run_server_async(server, port=port, transport="http") as url:
-        yield url
+    """Start OAuth-enabled server in-process."""
+    server = fastmcp_server(ASGI_BASE_URL)
+    async with asgi_server(server) as running_server:
+        yield running_server
 
 
 @pytest.fixture
-def client_unauthorized(streamable_http_server: str) -> Client:
-    return Client(transport=StreamableHttpTransport(streamable_http_server))
+def client_unauthorized(streamable_http_server: ASGIServer) -> Client:
+    return Client(transport=streamable_http_server.transport())
 
 
 @pytest.fixture
-def client_with_headless_oauth(streamable_http_server: str) -> Client:
+def client_with_headless_oauth(streamable_http_server: ASGIServer) -> Client:
     """Client with headless OAuth that bypasses browser interaction."""
     return Client(
-        transport=StreamableHttpTransport(streamable_http_server),
-        auth=HeadlessOAuth(mcp_url=streamable_http_server, scopes=["read", "write"]),
+        transport=streamable_http_server.transport(),
+        auth=HeadlessOAuth(
+            mcp_url=streamable_http_server.url, scopes=["read", "write"]
+        ),
     )
 
 
@@ -103,15 +106,17 @@ async def test_unauthorized(client_unauthorized: Client):
     assert exc_info.value.__cause__ is not exc_info.value
 
 
-async def test_ping(streamable_http_server: str):
+async def test_ping(streamable_http_server: ASGIServer):
     """Test that we can ping the server.
 
     Pinned to legacy: `ping` is a handshake-era request removed from the modern
     (2026-07-28) protocol.
     """
     client = Client(
-        transport=StreamableHttpTransport(streamable_http_server),
-        auth=HeadlessOAuth(mcp_url=streamable_http_server, scopes=["read", "write"]),
+        transport=streamable_http_server.transport(),
+        auth=HeadlessOAuth(
+            mcp_url=streamable_http_server.url, scopes=["read", "write"]
+        ),
         mode="legacy",
     )
     async with client:
@@ -151,12 +156,11 @@ async def test_read_resource(client_with_headless_oauth: Client):
         assert resource[0].text == "Hello from authenticated resource!"
 
 
-async def test_oauth_server_metadata_discovery(streamable_http_server: str):
+async def test_oauth_server_metadata_discovery(streamable_http_server: ASGIServer):
     """Test that we can discover OAuth metadata from the running server."""
-    parsed_url = urlparse(streamable_http_server)
-    server_base_url = f"{parsed_url.scheme}://{parsed_url.netloc}"
+    server_base_url = streamable_http_server.base_url
 
-    async with httpx2.AsyncClient() as client:
+    async with streamable_http_server.http_client() as client:
         # Test OAuth discovery endpoint
         metadata_url = f"{server_base_url}/.well-known/oauth-authorization-server"
         response = await client.get(metadata_url)
@@ -173,17 +177,15 @@ async def test_oauth_server_metadata_discovery(streamable_http_server: str):
 
 
 async def test_expired_dynamic_registration_is_retried():
-    port = find_available_port()
-    base_url = f"http://127.0.0.1:{port}"
-    provider = ExpiredFirstRegistrationProvider(base_url)
+    provider = ExpiredFirstRegistrationProvider(ASGI_BASE_URL)
     server = FastMCP("TestServer", auth=provider)
 
-    async with run_server_async(server, port=port, transport="http") as url:
+    async with asgi_server(server) as running_server:
         # Pinned to legacy: `ping` is a handshake-era request removed from the
         # modern (2026-07-28) protocol; the retry is exercised via the handshake.
         client = Client(
-            transport=StreamableHttpTransport(url),
-            auth=HeadlessOAuth(mcp_url=url),
+            transport=running_server.transport(),
+            auth=HeadlessOAuth(mcp_url=running_server.url),
             mode="legacy",
         )
         async with client:
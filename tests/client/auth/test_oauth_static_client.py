@@ -1,5 +1,7 @@
 """Tests for OAuth static client registration (pre-registered client_id/client_secret)."""
 
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
 from unittest.mock import patch
 
 import httpx2
@@ -10,12 +12,10 @@ from pydantic import AnyUrl
 from fastmcp.client import Client
 from fastmcp.client.auth import OAuth
 from fastmcp.client.auth.oauth import ClientNotFoundError
-from fastmcp.client.transports import StreamableHttpTransport
-from fastmcp.server.auth.auth import ClientRegistrationOptions
 from fastmcp.server.auth.providers.in_memory import InMemoryOAuthProvider
-from fastmcp.server.server import FastMCP
-from fastmcp.utilities.http import find_available_port
-from fastmcp.utilities.tests import HeadlessOAuth, run_server_async
+from fastmcp.utilities.tests import ASGIServer, HeadlessOAuth
+
+CALLBACK_PORT = 9999
 
 
 class TestStaticClientInfoConstruction:
@@ -173,103 +173,95 @@ class TestStaticClientRetryBehavior:
             assert call_count == 2
 
 
-class TestStaticClientE2E:
-    """End-to-end tests with a real OAuth server using pre-registered clients."""
-
-    async def test_static_client_with_dcr_disabled(self):
-        """Static client_id should work when the server has DCR disabled."""
-        port = find_available_port()
-        callback_port = find_available_port()
-        issuer_url = f"http://127.0.0.1:{port}"
-
-        provider = InMemoryOAuthProvider(
-            base_url=issuer_url,
-            client_registration_options=ClientRegistrationOptions(
-                enabled=False,  # DCR disabled
-                valid_scopes=["read", "write"],
-            ),
-        )
+async def _lists_greet(client: Client) -> None:
+    tools = await client.list_tools()
+    assert any(t.name == "greet" for t in tools)
 
-        server = FastMCP("TestServer", auth=provider)
-
-        @server.tool
-        def greet(name: str) -> str:
-            return f"Hello, {name}!"
-
-        # Pre-register a client directly in the provider.
-        # The redirect_uri must match what the OAuth client will use.
-        pre_registered = OAuthClientInformationFull(
-            client_id="pre-registered-client",
-            client_secret="pre-registered-secret",
-            redirect_uris=[AnyUrl(f"http://localhost:{callback_port}/callback")],
-            grant_types=["authorization_code", "refresh_token"],
-            response_types=["code"],
-            token_endpoint_auth_method="client_secret_post",
-            scope="read write",
-        )
-        await provider.register_client(pre_registered)
-
-        async with run_server_async(server, port=port, transport="http") as url:
-            oauth = HeadlessOAuth(
-                mcp_url=url,
-                client_id="pre-registered-client",
-                client_secret="pre-registered-secret",
-                scopes=["read", "write"],
-                callback_port=callback_port,
-            )
-
-            async with Client(
-                transport=StreamableHttpTransport(url),
-                auth=oauth,
-                mode="legacy",  # `ping` is a handshake-era request
-            ) as client:
-                assert await client.ping()
-                tools = await client.list_tools()
-                assert any(t.name == "greet" for t in tools)
-
-    async def test_static_client_with_dcr_enabled(self):
-        """Static client_id should also work when DCR is enabled (skips DCR)."""
-        port = find_available_port()
-        callback_port = find_available_port()
-        issuer_url = f"http://127.0.0.1:{port}"
-
-        provider = InMemoryOAuthProvider(
-            base_url=issuer_url,
-            client_registration_options=ClientRegistrationOptions(
-                enabled=True,
-                valid_scopes=["read"],
-            ),
-        )
 
-        server = FastMCP("TestServer", auth=provider)
+async def _calls_add(client: Client) -> None:
+    result = await client.call_tool("add", {"a": 3, "b": 4})
+    assert result.data == 7
 
-        @server.tool
-        def add(a: int, b: int) -> int:
-            return a + b
 
-        pre_registered = OAuthClientInformationFull(
-            client_id="my-app",
-            client_secret="my-secret",
-            redirect_uris=[AnyUrl(f"http://localhost:{callback_port}/callback")],
-            grant_types=["authorization_code", "refresh_token"],
-            response_types=["code"],
-            token_endpoint_auth_method="client_secret_post",
-            scope="read",
+def _pre_registered(
+    client_id: str, client_secret: str, scope: str
+) -> OAuthClientInformationFull:
+    """Client info to register directly in the provider.
+
+    The redirect_uri must match what the OAuth client will use.
+    """
+    return OAuthClientInformationFull(
+        client_id=client_id,
+        client_secret=client_secret,
+        redirect_uris=[AnyUrl(f"http://localhost:{CALLBACK_PORT}/callback")],
+        grant_types=["authorization_code", "refresh_token"],
+        response_types=["code"],
+        token_endpoint_auth_method="client_secret_post",
+        scope=scope,
+    )
+
+
+@dataclass(frozen=True)
+class StaticClientCase:
+    """One pre-registered client and what it should be able to do."""
+
+    dcr_enabled: bool
+    client_info: OAuthClientInformationFull
+    check: Callable[[Client], Awaitable[None]]
+
+
+# Built once at import: the callback port is fixed, so no field varies per run.
+STATIC_CLIENT_CASES = [
+    # Static client_id should work when the server has DCR disabled.
+    pytest.param(
+        StaticClientCase(
+            dcr_enabled=False,
+            client_info=_pre_registered(
+                "pre-registered-client", "pre-registered-secret", "read write"
+            ),
+            check=_lists_greet,
+        ),
+        id="dcr-disabled",
+    ),
+    # Static client_id should also work when DCR is enabled (skips DCR).
+    pytest.param(
+        StaticClientCase(
+            dcr_enabled=True,
+            client_info=_pre_registered("my-app", "my-secret", "read"),
+            check=_calls_add,
+        ),
+        id="dcr-enabled",
+    ),
+]
+
+
+@pytest.mark.asyncio(loop_scope="module")
+class TestStaticClientE2E:
+    """End-to-end tests with a real OAuth server using pre-registered clients.
+
+    The servers come from module-scoped fixtures and run in-process, so the full
+    OAuth flow runs with no sockets. `HeadlessOAuth` never opens its callback
+    server, so the callback port only has to match the pre-registered redirect URI.
+    """
+
+    @pytest.mark.parametrize("case", STATIC_CLIENT_CASES)
+    async def test_static_client(
+        self,
+        case: StaticClientCase,
+        dcr_server: tuple[ASGIServer, InMemoryOAuthProvider],
+        static_server: tuple[ASGIServer, InMemoryOAuthProvider],
+    ):
+        running_server, provider = dcr_server if case.dcr_enabled else static_server
+
+        await provider.register_client(case.client_info)
+
+        oauth = HeadlessOAuth(
+            mcp_url=running_server.url,
+            client_id=case.client_info.client_id,
+            client_secret=case.client_info.client_secret,
+            scopes=case.client_info.scope,
+            callback_port=CALLBACK_PORT,
         )
-        await provider.register_client(pre_registered)
-
-        async with run_server_async(server, port=port, transport="http") as url:
-            oauth = HeadlessOAuth(
-                mcp_url=url,
-                client_id="my-app",
-                client_secret="my-secret",
-                scopes=["read"],
-                callback_port=callback_port,
-            )
-
-            async with Client(
-                transport=StreamableHttpTransport(url),
-                auth=oauth,
-            ) as client:
-                result = await client.call_tool("add", {"a": 3, "b": 4})
-                assert result.data == 7
+
+        async with Client(transport=running_server.transport(auth=oauth)) as client:
+            await case.check(client)
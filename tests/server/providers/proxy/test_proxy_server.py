@@ -1414,20 +1414,16 @@ class TestProxyForwardingAppliesToEveryBackendClient:
         assert result.structured_content == {"status": "weird"}
 
     async def test_single_server_config_target_forwards(self, backend):
-        port = find_available_port()
-        async with run_server_async(backend, port=port):
-            config = MCPConfig.from_dict(
-                {"mcpServers": {"a": {"url": f"http://127.0.0.1:{port}/mcp/"}}}
-            )
+        async with run_server_async(backend) as url:
+            config = MCPConfig.from_dict({"mcpServers": {"a": {"url": f"{url}/"}}})
             result = await self._forwarded(create_proxy(Client(config)))
 
         assert result.is_error is False
         assert result.structured_content == {"status": "weird"}
 
     async def test_multi_server_config_target_forwards(self, backend):
-        port = find_available_port()
-        async with run_server_async(backend, port=port):
-            url = f"http://127.0.0.1:{port}/mcp/"
+        async with run_server_async(backend) as mcp_url:
+            url = f"{mcp_url}/"
             config = MCPConfig.from_dict(
                 {"mcpServers": {"a": {"url": url}, "b": {"url": url}}}
             )
@@ -0,0 +1,133 @@
+import functools
+import math
+
+import pytest
+from mcp_types import TextContent
+
+from fastmcp.tools.base import Tool
+from fastmcp.tools.function_parsing import _cached_partial_input_schema
+from fastmcp.utilities.func import wrapped_partial
+
+
+def add(a: int, b: int, c: int = 3) -> int:
+    """Add three numbers."""
+    return a + b + c
+
+
+async def greet(greeting: str, name: str) -> str:
+    """Greet someone."""
+    return f"{greeting}, {name}!"
+
+
+EXPECTED_15 = [TextContent(type="text", text="15")]
+EXPECTED_GREETING = [TextContent(type="text", text="Hey, World!")]
+
+
+@pytest.fixture(scope="class")
+def add_ten() -> Tool:
+    """Shared by tests that only inspect the tool; don't mutate it."""
+    return Tool.from_function(functools.partial(add, b=10), name="add_ten")
+
+
+class TestPartialTool:
+    """Test tools built from functools.partial objects."""
+
+    async def test_partial_sync(self):
+        tool = Tool.from_function(functools.partial(add, b=10), name="add_ten")
+        result = await tool.run({"a": 2})
+        assert result.content == EXPECTED_15
+
+    async def test_partial_async(self):
+        tool = Tool.from_function(functools.partial(greet, greeting="Hey"), name="hey")
+        result = await tool.run({"name": "World"})
+        assert result.content == EXPECTED_GREETING
+
+    async def test_partial_preserves_name(self):
+        tool = Tool.from_function(wrapped_partial(add, b=10))
+        assert tool.name == "add"
+        assert tool.description == "Add three numbers."
+
+        result = await tool.run({"a": 2})
+        assert result.content == EXPECTED_15
+
+    def test_partial_custom_name(self, add_ten: Tool):
+        assert add_ten.name == "add_ten"
+
+    def test_partial_schema_shows_bound_args_as_optional(self, add_ten: Tool):
+        assert add_ten.parameters["required"] == ["a"]
+        assert add_ten.parameters["properties"]["b"]["default"] == 10
+
+
+class TestPartialSchemaCache:
+    """Equivalent partials should reuse one generated input schema."""
+
+    def test_equivalent_partials_share_schema(self):
+        _cached_partial_input_schema.cache_clear()
+
+        Tool.from_function(functools.partial(add, b=10), name="first")
+        Tool.from_function(functools.partial(add, b=10), name="second")
+
+        info = _cached_partial_input_schema.cache_info()
+        assert info.misses == 1
+        assert info.hits == 1
+
+    def test_different_bindings_get_distinct_schemas(self):
+        ten = Tool.from_function(functools.partial(add, b=10), name="add_ten")
+        flag = Tool.from_function(functools.partial(add, b=True), name="add_flag")
+        assert ten.parameters["properties"]["b"]["default"] == 10
+        assert flag.parameters["properties"]["b"]["default"] is True
+
+    def test_nested_bindings_are_not_conflated(self):
+        def first(a: int, b: tuple[int | bool, ...]) -> int:
+            return a + b[0]
+
+        ints = Tool.from_function(functools.partial(first, b=(1,)), name="ints")
+        bools = Tool.from_function(functools.partial(first, b=(True,)), name="bools")
+        assert ints.parameters["properties"]["b"]["default"] == [1]
+        assert bools.parameters["properties"]["b"]["default"] == [True]
+        assert bools.parameters["properties"]["b"]["default"][0] is True
+
+    def test_signed_zero_bindings_are_not_conflated(self):
+        def shift(a: float, b: float) -> float:
+            return a + b
+
+        pos = Tool.from_function(functools.partial(shift, b=0.0), name="pos")
+        neg = Tool.from_function(functools.partial(shift, b=-0.0), name="neg")
+        assert math.copysign(1, pos.parameters["properties"]["b"]["default"]) == 1
+        assert math.copysign(1, neg.parameters["properties"]["b"]["default"]) == -1
+
+    def test_update_wrapper_is_part_of_the_key(self):
+        wrapped = functools.partial(add, b=10)
+        functools.update_wrapper(wrapped, add)
+
+        plain = Tool.from_function(functools.partial(add, b=10), name="add_ten")
+        tool = Tool.from_function(wrapped)
+        assert plain.parameters["required"] == ["a"]
+        assert tool.parameters["required"] == ["a", "b"]
+
+    def test_unhashable_bindings_are_not_cached(self):
+        def total(values: list[int], extra: int) -> int:
+            return sum(values) + extra
+
+        _cached_partial_input_schema.cache_clear()
+        tool = Tool.from_function(functools.partial(total, values=[1, 2]), name="t")
+
+        assert tool.parameters["required"] == ["extra"]
+        assert _cached_partial_input_schema.cache_info().currsize == 0
+
+    def test_cached_schema_is_not_mutated_by_docstrings(self):
+        def scale(x: int, factor: int) -> int:
+            """Scale a number.
+
+            Args:
+                x: The number to scale.
+            """
+            return x * factor
+
+        tool = Tool.from_function(wrapped_partial(scale, factor=2))
+        undescribed = Tool.from_function(functools.partial(scale, factor=2), name="s")
+
+        assert tool.parameters["properties"]["x"]["description"] == (
+            "The number to scale."
+        )
+        assert "description" not in undescribed.parameters["properties"]["x"]
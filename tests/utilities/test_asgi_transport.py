@@ -194,6 +194,17 @@ class TestRunServerInMemory:
         async with asgi_server(build_server(), transport="http") as server:
             assert server.url.endswith("/mcp")
 
+    async def test_base_url_is_origin_of_url(self):
+        async with asgi_server(build_server(), path="/custom") as server:
+            assert server.base_url == "http://127.0.0.1"
+            assert server.url == f"{server.base_url}/custom"
+
+    def test_base_url_defaults_to_origin_of_url(self):
+        server = ASGIServer(
+            url="http://testserver/mcp", app=Starlette(), transport_type="http"
+        )
+        assert server.base_url == "http://testserver"
+
     async def test_custom_path_is_used(self):
         async with asgi_server(build_server(), path="/custom") as server:
             assert server.url.endswith("/custom")
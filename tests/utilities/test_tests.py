@@ -1,10 +1,16 @@
-from unittest.mock import AsyncMock, MagicMock, patch
+import asyncio
+import socket
+from unittest.mock import DEFAULT, AsyncMock, MagicMock, patch
 
 import pytest
 
 import fastmcp
 from fastmcp import FastMCP
-from fastmcp.utilities.tests import HeadlessOAuth, temporary_settings
+from fastmcp.utilities.tests import (
+    HeadlessOAuth,
+    run_server_async,
+    temporary_settings,
+)
 
 
 class TestTemporarySettings:
@@ -14,6 +20,11 @@ class TestTemporarySettings:
             assert fastmcp.settings.log_level == "ERROR"
         assert fastmcp.settings.log_level == "DEBUG"
 
+    def test_temporary_settings_restores_after_error(self):
+        with pytest.raises(RuntimeError), temporary_settings(log_level="ERROR"):
+            raise RuntimeError("boom")
+        assert fastmcp.settings.log_level == "DEBUG"
+
 
 class TestTransportSetting:
     def test_transport_default_is_stdio(self):
@@ -26,21 +37,63 @@ class TestTransportSetting:
 
     async def test_run_async_uses_transport_setting(self):
         mcp = FastMCP("test")
-        with temporary_settings(transport="http"):
-            with patch.object(
-                mcp, "run_http_async", new_callable=AsyncMock
-            ) as mock_http:
-                await mcp.run_async()
-                mock_http.assert_called_once()
+        with (
+            temporary_settings(transport="http"),
+            patch.multiple(
+                mcp,
+                new_callable=AsyncMock,
+                run_http_async=DEFAULT,
+                run_stdio_async=DEFAULT,
+            ) as mocks,
+        ):
+            await mcp.run_async()
+        mocks["run_http_async"].assert_called_once()
+        mocks["run_stdio_async"].assert_not_called()
 
     async def test_run_async_explicit_transport_overrides_setting(self):
         mcp = FastMCP("test")
-        with temporary_settings(transport="http"):
-            with patch.object(
-                mcp, "run_stdio_async", new_callable=AsyncMock
-            ) as mock_stdio:
-                await mcp.run_async(transport="stdio")
-                mock_stdio.assert_called_once()
+        with (
+            temporary_settings(transport="http"),
+            patch.multiple(
+                mcp,
+                new_callable=AsyncMock,
+                run_http_async=DEFAULT,
+                run_stdio_async=DEFAULT,
+            ) as mocks,
+        ):
+            await mcp.run_async(transport="stdio")
+        mocks["run_stdio_async"].assert_called_once()
+        mocks["run_http_async"].assert_not_called()
+
+
+class TestRunServerAsync:
+    async def test_startup_failure_closes_socket_and_cancels_server(self):
+        mcp = FastMCP("test")
+        bound: list[socket.socket] = []
+        cancelled = asyncio.Event()
+
+        async def fake_run_http_async(**kwargs):
+            bound.extend(kwargs["sockets"])
+            mcp._started.set()
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        with (
+            patch.object(mcp, "run_http_async", side_effect=fake_run_http_async),
+            patch(
+                "fastmcp.utilities.tests._wait_for_port",
+                side_effect=RuntimeError("never bound"),
+            ),
+            pytest.raises(RuntimeError, match="never bound"),
+        ):
+            async with run_server_async(mcp):
+                pass
+
+        assert cancelled.is_set()
+        assert [sock.fileno() for sock in bound] == [-1]
 
 
 class TestHeadlessOAuthCallbackHandler: